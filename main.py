@@ -1,16 +1,265 @@
-
+import asyncio
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import chain, starmap
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+from urllib.parse import urlencode
+
+import anyio
 import httpx
+import msgspec
+import orjson
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
-from tabulate import tabulate
 from dotenv import load_dotenv
 import os
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Read the API key once at startup; a server without one cannot serve any tool
+API_KEY = os.getenv("CRYPTORANK_API_KEY")
+if not API_KEY:
+    raise ValueError("CRYPTORANK_API_KEY environment variable is required in .env file.")
+_HEADERS = {"X-Api-Key": API_KEY}
+
+FUNDS_URL = "https://api.cryptorank.io/v2/funds"
+FUND_MAP_URL = f"{FUNDS_URL}/map"
+
+# Limits for the batched get_funds_detail tool
+MAX_BATCH_FUND_IDS = 20
+MAX_CONCURRENT_REQUESTS = 5
+
+# Shared HTTP client, created on first use so every tool call reuses the
+# same pooled (HTTP/2) connection to the Cryptorank API
+_client: Optional[httpx.AsyncClient] = None
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            headers=_HEADERS,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20),
+            timeout=10,
+        )
+    return _client
+
+# Requests currently in flight, keyed by URL and decoder
+_inflight: Dict[Tuple[str, Callable[[bytearray], Any]], "asyncio.Task[Any]"] = {}
+
+async def _request_json(url: str, decode: Callable[[bytearray], Any]) -> Any:
+    # Read the body in chunks into one buffer and decode the raw bytes
+    # directly; the fund map in particular is large
+    client = _get_client()
+    body = bytearray()
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes(65536):
+            body += chunk
+    return decode(body)
+
+async def _fetch(url: str, decode: Callable[[bytearray], Any] = orjson.loads) -> Any:
+    """
+    GET a Cryptorank endpoint and return the JSON body decoded with `decode`.
+    Concurrent calls for the same URL and decoder share a single request.
+    """
+    key = (url, decode)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_request_json(url, decode))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield the shared request so one caller being cancelled does not
+    # cancel it for the others
+    return await asyncio.shield(task)
+
+@lru_cache(maxsize=256)
+def _search_url(
+    tier: Tuple[int, ...],
+    type: Tuple[str, ...],
+    sortBy: str,
+    sortDirection: str,
+    limit: int,
+    skip: int,
+) -> str:
+    """Build the encoded /v2/funds query URL for a set of search arguments."""
+    params: Dict[str, Any] = {
+        "sortBy": sortBy,
+        "sortDirection": sortDirection,
+        "limit": limit,
+        "skip": skip,
+    }
+
+    # Add optional filters if provided
+    if tier:
+        params["tier"] = tier
+    if type:
+        params["type"] = type
+
+    return f"{FUNDS_URL}?{urlencode(params, doseq=True)}"
+
+# Rendered tables for the fund list tools, keyed by tool name and arguments
+_cache: TTLCache = TTLCache(maxsize=128, ttl=300)
+
+# The fund list endpoints are decoded by msgspec straight into these
+# structs, skipping the per-fund dict; field order is the table column order.
+# Fields missing from a record stay UNSET: "N/A" in grid/tsv, null in json.
+class Fund(msgspec.Struct):
+    id: Any = msgspec.UNSET
+    key: Any = msgspec.UNSET
+    name: Any = msgspec.UNSET
+    tier: Any = msgspec.UNSET
+    type: Any = msgspec.UNSET
+    jurisdiction: Any = msgspec.UNSET
+    portfolio: Any = msgspec.UNSET
+    fundingRounds: Any = msgspec.UNSET
+    retailRoi: Any = msgspec.UNSET
+    leadInvestments: Any = msgspec.UNSET
+
+class FundMapEntry(msgspec.Struct):
+    id: Any = msgspec.UNSET
+    name: Any = msgspec.UNSET
+    tier: Any = msgspec.UNSET
+    type: Any = msgspec.UNSET
+
+class FundsResponse(msgspec.Struct):
+    data: Optional[List[Fund]] = None
+
+class FundMapResponse(msgspec.Struct):
+    data: Optional[List[FundMapEntry]] = None
+
+_decode_funds = msgspec.json.Decoder(FundsResponse).decode
+_decode_fund_map = msgspec.json.Decoder(FundMapResponse).decode
+
+# API fields and matching column headers for each table
+FUND_HEADERS = [
+    "ID", "Key", "Name", "Tier", "Type", "Jurisdiction",
+    "Portfolio", "Funding Rounds", "Retail ROI", "Lead Investments",
+]
+FUND_MAP_HEADERS = ["ID", "Name", "Tier", "Type"]
+LINK_FIELDS = ("type", "value")
+LINK_HEADERS = ["Type", "Value"]
+FOCUS_AREA_FIELDS = ("id", "name", "percent")
+FOCUS_AREA_HEADERS = ["ID", "Name", "Percent"]
+INVESTMENT_FIELDS = ("id", "symbol", "name", "logo")
+INVESTMENT_HEADERS = ["ID", "Symbol", "Name", "Logo"]
+LOCATION_FIELDS = ("code", "count")
+LOCATION_HEADERS = ["Code", "Count"]
+ROUND_FIELDS = ("id", "name", "logo", "raise", "date")
+ROUND_HEADERS = ["ID", "Name", "Logo", "Raise", "Date"]
+AVG_RAISE_FIELDS = ("raiseFrom", "raiseTo", "percent")
+AVG_RAISE_HEADERS = ["Raise From", "Raise To", "Percent"]
+STAGE_HEADERS = ["Type", "Percent"]
+TEAM_HEADERS = ["ID", "Name", "Jobs", "Priority"]
+TEAM_LINK_HEADERS = ["Member Name", "Link Type", "Link Value"]
+FIELD_VALUE_HEADERS = ["Field", "Value"]
+
+# (label, API field) pairs for the Field/Value metrics table of a single fund
+BASIC_METRIC_FIELDS = (
+    ("ID", "id"),
+    ("Key", "key"),
+    ("Name", "name"),
+    ("Tier", "tier"),
+    ("Type", "type"),
+    ("Jurisdiction", "jurisdiction"),
+    ("Portfolio", "portfolio"),
+    ("Funding Rounds", "fundingRounds"),
+    ("Retail ROI", "retailRoi"),
+    ("Lead Investments", "leadInvestments"),
+)
+DETAIL_METRIC_FIELDS = (
+    ("ID", "id"),
+    ("Key", "key"),
+    ("Name", "name"),
+    ("Tier", "tier"),
+    ("Type", "type"),
+    ("Jurisdiction", "jurisdiction"),
+    ("Description", "description"),
+    ("Portfolio", "portfolio"),
+    ("Funding Rounds", "fundingRounds"),
+    ("Retail ROI", "retailRoi"),
+    ("Lead Investments", "leadInvestments"),
+)
+
+def _row_getter(fields: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    """
+    Build a row extractor that fills fields missing from a record with "N/A".
+    The extractor is generated as straight-line code with one record.get() per
+    field, so extracting a row runs no loop and builds no intermediate dict.
+    """
+    source = "def row(record):\n    return (" + "".join(f"record.get({k!r}, 'N/A'), " for k in fields) + ")\n"
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace["row"]
+
+def _float_columns(rows: List[Tuple[Any, ...]]) -> List[int]:
+    """Indexes of columns tabulate would treat as floats: all values numeric, at least one float."""
+    columns = []
+    for index, column in enumerate(zip(*rows)):
+        kinds = {type(value) for value in column if value is not None}
+        if float in kinds and kinds <= {int, float}:
+            columns.append(index)
+    return columns
+
+def _stringify(rows: List[Tuple[Any, ...]]) -> List[List[str]]:
+    """Convert every cell to text once, leaving missing (None) values empty."""
+    cells = [
+        ["" if value is None else "N/A" if value is msgspec.UNSET else str(value) for value in row]
+        for row in rows
+    ]
+    # Print float columns with the "g" format, as tabulate did (50.0 -> 50)
+    for index in _float_columns(rows):
+        for row, text in zip(rows, cells):
+            if row[index] is not None:
+                text[index] = format(row[index], "g")
+    # Keep every row on a single line and tabs out of the cells, for the
+    # grid and the TSV alike; one scan over all cells is cheaper than a
+    # per-cell check, and such values are rare
+    joined = "".join(chain.from_iterable(cells))
+    if "\n" in joined or "\t" in joined:
+        cells = [[text.replace("\n", " ").replace("\t", " ") for text in row] for row in cells]
+    return cells
+
+def _render_grid(rows: List[Tuple[Any, ...]], headers: List[str]) -> str:
+    """Render rows as an ASCII grid table, in the layout of tabulate's "grid" format."""
+    cells = _stringify(rows)
+    # Headers keep tabulate's minimum padding of two spaces
+    widths = [max(len(h) + 2, *map(len, col)) for h, col in zip(headers, zip(*cells))]
+    separator = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+    header_separator = "+" + "+".join("=" * (w + 2) for w in widths) + "+"
+    # One format string per table pads every cell of a row in a single
+    # C-level str.format call instead of a Python loop over ljust()
+    row_format = "| " + " | ".join(f"{{:<{w}}}" for w in widths) + " |"
+    body = f"\n{separator}\n".join(starmap(row_format.format, cells))
+    return "\n".join((separator, row_format.format(*headers), header_separator, body, separator))
+
+TableFormat = Literal["grid", "json", "tsv"]
+
+def _json_default(value: Any) -> Any:
+    # Fields missing from the API record are null in JSON, not "N/A"
+    if value is msgspec.UNSET:
+        return None
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def _render_table(rows: List[Tuple[Any, ...]], headers: List[str], format: TableFormat) -> str:
+    """Render rows as an ASCII grid for people, or as compact JSON / TSV for programs."""
+    if format == "json":
+        return orjson.dumps({"columns": headers, "rows": rows}, default=_json_default).decode()
+    if format == "tsv":
+        return "\n".join(["\t".join(headers), *map("\t".join, _stringify(rows))])
+    return _render_grid(rows, headers)
+
+_link_row = _row_getter(LINK_FIELDS)
+_focus_area_row = _row_getter(FOCUS_AREA_FIELDS)
+_investment_row = _row_getter(INVESTMENT_FIELDS)
+_location_row = _row_getter(LOCATION_FIELDS)
+_round_row = _row_getter(ROUND_FIELDS)
+_avg_raise_row = _row_getter(AVG_RAISE_FIELDS)
+
 mcp = FastMCP(
     "Crypto Funds MCP",
-    dependencies=["httpx", "tabulate"],
+    dependencies=["cachetools", "httpx[http2]", "msgspec", "orjson"],
 )
 
 @mcp.tool()
@@ -20,11 +269,12 @@ async def search_funds(
     sortBy: str = "tier",
     sortDirection: str = "ASC",
     limit: int = 100,
-    skip: int = 0
+    skip: int = 0,
+    format: TableFormat = "grid",
 ) -> str:
     """
     Fetch a sortable and filterable list of funds and investors with key metrics from Cryptorank API.
-    Returns an ASCII table string of the data.
+    Returns an ASCII table string of the data, or JSON / TSV if requested.
 
     Parameters:
     - tier: List of tier numbers (1-5) to filter by.
@@ -33,111 +283,62 @@ async def search_funds(
     - sortDirection: Sort direction ("ASC" or "DESC").
     - limit: Number of results to return (100, 200, or 300).
     - skip: Number of results to skip.
+    - format: Output format ("grid" ASCII table, "json" or "tsv").
     """
-    api_key = os.getenv("CRYPTORANK_API_KEY")
-    if not api_key:
-        raise ValueError("CRYPTORANK_API_KEY environment variable is required in .env file.")
-
-    url = "https://api.cryptorank.io/v2/funds"
-    headers = {"X-Api-Key": api_key}
-    params = {
-        "sortBy": sortBy,
-        "sortDirection": sortDirection,
-        "limit": limit,
-        "skip": skip
-    }
+    cache_key = ("search_funds", tuple(tier or ()), tuple(type or ()), sortBy, sortDirection, limit, skip, format)
+    cached = _cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    # Add optional filters if provided
-    if tier:
-        params["tier"] = tier
-    if type:
-        params["type"] = type
+    url = _search_url(tuple(tier or ()), tuple(type or ()), sortBy, sortDirection, limit, skip)
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            # Extract the 'data' field, which is the list of funds
-            funds_data = data.get("data", [])
-
-            if not funds_data:
-                return "No funds data available for the specified filters."
-
-            # Prepare data for table
-            table_data = [
-                {
-                    "ID": fund.get("id", "N/A"),
-                    "Key": fund.get("key", "N/A"),
-                    "Name": fund.get("name", "N/A"),
-                    "Tier": fund.get("tier", "N/A"),
-                    "Type": fund.get("type", "N/A"),
-                    "Jurisdiction": fund.get("jurisdiction", "N/A"),
-                    "Portfolio": fund.get("portfolio", "N/A"),
-                    "Funding Rounds": fund.get("fundingRounds", "N/A"),
-                    "Retail ROI": fund.get("retailRoi", "N/A"),
-                    "Lead Investments": fund.get("leadInvestments", "N/A"),
-                }
-                for fund in funds_data
-            ]
-
-            # Format as ASCII table
-            return tabulate(
-                table_data,
-                headers="keys",
-                tablefmt="grid",
-                stralign="left",
-                numalign="center",
-            )
+        response = await _fetch(url, _decode_funds)
+
+        # Extract the 'data' field, which is the list of funds
+        funds_data = response.data
+
+        if not funds_data:
+            return "No funds data available for the specified filters."
+
+        # Prepare data for table
+        table_data = list(map(msgspec.structs.astuple, funds_data))
+
+        output = _render_table(table_data, FUND_HEADERS, format)
+        _cache[cache_key] = output
+        return output
     except httpx.HTTPError as e:
         raise ValueError(f"Failed to fetch funds: {str(e)}") from e
 
 @mcp.tool()
-async def get_all_funds() -> str:
+async def get_all_funds(format: TableFormat = "grid") -> str:
     """
     Fetch the complete list of investors and funds from Cryptorank API.
-    Returns an ASCII table string of the data.
-    """
-    api_key = os.getenv("CRYPTORANK_API_KEY")
-    if not api_key:
-        raise ValueError("CRYPTORANK_API_KEY environment variable is required in .env file.")
+    Returns an ASCII table string of the data, or JSON / TSV if requested.
 
-    url = "https://api.cryptorank.io/v2/funds/map"
-    headers = {"X-Api-Key": api_key}
+    Parameters:
+    - format: Output format ("grid" ASCII table, "json" or "tsv").
+    """
+    cache_key = ("get_all_funds", format)
+    cached = _cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            # Extract the 'data' field, which is the list of funds
-            funds_data = data.get("data", [])
-
-            if not funds_data:
-                return "No funds data available."
-
-            # Prepare data for table
-            table_data = [
-                {
-                    "ID": fund.get("id", "N/A"),
-#                    "Key": fund.get("key", "N/A"),
-                    "Name": fund.get("name", "N/A"),
-                    "Tier": fund.get("tier", "N/A"),
-                    "Type": fund.get("type", "N/A"),
-                }
-                for fund in funds_data
-            ]
-
-            # Format as ASCII table
-            return tabulate(
-                table_data,
-                headers="keys",
-                tablefmt="grid",
-                stralign="left",
-                numalign="center",
-            )
+        response = await _fetch(FUND_MAP_URL, _decode_fund_map)
+
+        # Extract the 'data' field, which is the list of funds
+        funds_data = response.data
+
+        if not funds_data:
+            return "No funds data available."
+
+        # Prepare data for table
+        table_data = list(map(msgspec.structs.astuple, funds_data))
+
+        output = _render_table(table_data, FUND_MAP_HEADERS, format)
+        _cache[cache_key] = output
+        return output
     except httpx.HTTPError as e:
         raise ValueError(f"Failed to fetch funds: {str(e)}") from e
 
@@ -147,329 +348,164 @@ async def get_fund_basic(fund_id: int) -> str:
     Fetch basic metrics for a specific fund by ID from Cryptorank API.
     Returns an ASCII table string of the fund metrics.
     """
-    api_key = os.getenv("CRYPTORANK_API_KEY")
-    if not api_key:
-        raise ValueError("CRYPTORANK_API_KEY environment variable is required in .env file.")
+    try:
+        data = await _fetch(f"{FUNDS_URL}/{fund_id}")
 
-    url = f"https://api.cryptorank.io/v2/funds/{fund_id}"
-    headers = {"X-Api-Key": api_key}
+        # Extract the 'data' field, which is a list with one fund
+        fund_data = data.get("data", [])
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            # Extract the 'data' field, which is a list with one fund
-            fund_data = data.get("data", [])
-
-            if not fund_data:
-                return f"No data available for fund ID {fund_id}."
-
-            fund = fund_data[0]
-
-            # Prepare main fund metrics for table
-            main_table_data = [
-                {
-                    "Field": "ID",
-                    "Value": fund.get("id", "N/A"),
-                },
-                {
-                    "Field": "Key",
-                    "Value": fund.get("key", "N/A"),
-                },
-                {
-                    "Field": "Name",
-                    "Value": fund.get("name", "N/A"),
-                },
-                {
-                    "Field": "Tier",
-                    "Value": fund.get("tier", "N/A"),
-                },
-                {
-                    "Field": "Type",
-                    "Value": fund.get("type", "N/A"),
-                },
-                {
-                    "Field": "Jurisdiction",
-                    "Value": fund.get("jurisdiction", "N/A"),
-                },
-                {
-                    "Field": "Portfolio",
-                    "Value": fund.get("portfolio", "N/A"),
-                },
-                {
-                    "Field": "Funding Rounds",
-                    "Value": fund.get("fundingRounds", "N/A"),
-                },
-                {
-                    "Field": "Retail ROI",
-                    "Value": fund.get("retailRoi", "N/A"),
-                },
-                {
-                    "Field": "Lead Investments",
-                    "Value": fund.get("leadInvestments", "N/A"),
-                },
-            ]
-
-            # Prepare focus areas table
-            focus_areas = fund.get("focusArea", [])
-            focus_table_data = [
-                {
-                    "ID": area.get("id", "N/A"),
-                    "Name": area.get("name", "N/A"),
-                    "Percent": area.get("percent", "N/A"),
-                }
-                for area in focus_areas
-            ]
-
-            # Prepare top investments table
-            top_investments = fund.get("topInvestments", [])
-            investments_table_data = [
-                {
-                    "ID": inv.get("id", "N/A"),
-                    "Symbol": inv.get("symbol", "N/A"),
-                    "Name": inv.get("name", "N/A"),
-                    "Logo": inv.get("logo", "N/A"),
-                }
-                for inv in top_investments
-            ]
-
-            # Combine all tables into a single string
-            output = "Fund Metrics:\n"
-            output += tabulate(
-                main_table_data,
-                headers="keys",
-                tablefmt="grid",
-                stralign="left",
-                numalign="center",
-            )
+        if not fund_data:
+            return f"No data available for fund ID {fund_id}."
+
+        fund = fund_data[0]
+
+        # Prepare main fund metrics for table
+        main_table_data = [(label, fund.get(key, "N/A")) for label, key in BASIC_METRIC_FIELDS]
+
+        # Prepare focus areas table
+        focus_areas = fund.get("focusArea", [])
+        focus_table_data = list(map(_focus_area_row, focus_areas))
 
-            if focus_table_data:
-                output += "\n\nFocus Areas:\n"
-                output += tabulate(
-                    focus_table_data,
-                    headers="keys",
-                    tablefmt="grid",
-                    stralign="left",
-                    numalign="center",
-                )
-
-            if investments_table_data:
-                output += "\n\nTop Investments (Last 12 Months):\n"
-                output += tabulate(
-                    investments_table_data,
-                    headers="keys",
-                    tablefmt="grid",
-                    stralign="left",
-                    numalign="center",
-                )
-
-            return output
+        # Prepare top investments table
+        top_investments = fund.get("topInvestments", [])
+        investments_table_data = list(map(_investment_row, top_investments))
+
+        # Collect the tables and join them once at the end
+        parts = ["Fund Metrics:\n" + _render_grid(main_table_data, FIELD_VALUE_HEADERS)]
+
+        if focus_table_data:
+            parts.append("Focus Areas:\n" + _render_grid(focus_table_data, FOCUS_AREA_HEADERS))
+
+        if investments_table_data:
+            parts.append("Top Investments (Last 12 Months):\n" + _render_grid(investments_table_data, INVESTMENT_HEADERS))
+
+        return "\n\n".join(parts)
     except httpx.HTTPError as e:
         raise ValueError(f"Failed to fetch metrics for fund ID {fund_id}: {str(e)}") from e
 
+def _format_fund_detail(fund: Dict[str, Any]) -> str:
+    """Render the full-metadata payload of a fund as a set of ASCII tables."""
+    # Prepare main fund metrics for table
+    main_table_data = [(label, fund.get(key, "N/A")) for label, key in DETAIL_METRIC_FIELDS]
+
+    # Prepare links table
+    links = fund.get("links", [])
+    links_table_data = list(map(_link_row, links))
+
+    # Prepare focus areas table
+    focus_areas = fund.get("focusArea", [])
+    focus_table_data = list(map(_focus_area_row, focus_areas))
+
+    # Prepare top investments table
+    top_investments = fund.get("topInvestments", [])
+    investments_table_data = list(map(_investment_row, top_investments))
+
+    # Prepare funding locations table
+    funding_locations = fund.get("fundingLocations", [])
+    locations_table_data = list(map(_location_row, funding_locations))
+
+    # Prepare recent rounds table
+    recent_rounds = fund.get("recentRounds", [])
+    rounds_table_data = list(map(_round_row, recent_rounds))
+
+    # Prepare average rounds raise table
+    avg_rounds_raise = fund.get("avgRoundsRaise", [])
+    avg_raise_table_data = list(map(_avg_raise_row, avg_rounds_raise))
+
+    # Prepare investment stages table
+    investment_stages = fund.get("investmentStages", [])
+    stages_table_data = [
+        (
+            stage.get("type", ["N/A"])[0] if stage.get("type") else "N/A",
+            stage.get("percent", "N/A"),
+        )
+        for stage in investment_stages
+    ]
+
+    # Collect the tables and join them once at the end
+    parts = ["Comprehensive Fund Data:\n" + _render_grid(main_table_data, FIELD_VALUE_HEADERS)]
+
+    if links_table_data:
+        parts.append("Links:\n" + _render_grid(links_table_data, LINK_HEADERS))
+
+    if focus_table_data:
+        parts.append("Focus Areas:\n" + _render_grid(focus_table_data, FOCUS_AREA_HEADERS))
+
+    if investments_table_data:
+        parts.append("Top Investments (Recent):\n" + _render_grid(investments_table_data, INVESTMENT_HEADERS))
+
+    if locations_table_data:
+        parts.append("Funding Locations:\n" + _render_grid(locations_table_data, LOCATION_HEADERS))
+
+    if rounds_table_data:
+        parts.append("Recent Funding Rounds:\n" + _render_grid(rounds_table_data, ROUND_HEADERS))
+
+    if avg_raise_table_data:
+        parts.append("Average Rounds Raise:\n" + _render_grid(avg_raise_table_data, AVG_RAISE_HEADERS))
+
+    if stages_table_data:
+        parts.append("Investment Stages:\n" + _render_grid(stages_table_data, STAGE_HEADERS))
+
+    return "\n\n".join(parts)
+
 @mcp.tool()
 async def get_fund_detail(fund_id: int) -> str:
     """
     Fetch comprehensive metrics and investment data for a specific fund by ID from Cryptorank API.
     Returns an ASCII table string of the fund data.
     """
-    api_key = os.getenv("CRYPTORANK_API_KEY")
-    if not api_key:
-        raise ValueError("CRYPTORANK_API_KEY environment variable is required in .env file.")
+    try:
+        data = await _fetch(f"{FUNDS_URL}/{fund_id}/full-metadata")
 
-    url = f"https://api.cryptorank.io/v2/funds/{fund_id}/full-metadata"
-    headers = {"X-Api-Key": api_key}
+        # Extract the 'data' field, which contains the fund details
+        fund = data.get("data", {})
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            # Extract the 'data' field, which contains the fund details
-            fund = data.get("data", {})
-
-            if not fund:
-                return f"No data available for fund ID {fund_id}."
-
-            # Prepare main fund metrics for table
-            main_table_data = [
-                {"Field": "ID", "Value": fund.get("id", "N/A")},
-                {"Field": "Key", "Value": fund.get("key", "N/A")},
-                {"Field": "Name", "Value": fund.get("name", "N/A")},
-                {"Field": "Tier", "Value": fund.get("tier", "N/A")},
-                {"Field": "Type", "Value": fund.get("type", "N/A")},
-                {"Field": "Jurisdiction", "Value": fund.get("jurisdiction", "N/A")},
-                {"Field": "Description", "Value": fund.get("description", "N/A")},
-                {"Field": "Portfolio", "Value": fund.get("portfolio", "N/A")},
-                {"Field": "Funding Rounds", "Value": fund.get("fundingRounds", "N/A")},
-                {"Field": "Retail ROI", "Value": fund.get("retailRoi", "N/A")},
-                {"Field": "Lead Investments", "Value": fund.get("leadInvestments", "N/A")},
-            ]
-
-            # Prepare links table
-            links = fund.get("links", [])
-            links_table_data = [
-                {
-                    "Type": link.get("type", "N/A"),
-                    "Value": link.get("value", "N/A"),
-                }
-                for link in links
-            ]
-
-            # Prepare focus areas table
-            focus_areas = fund.get("focusArea", [])
-            focus_table_data = [
-                {
-                    "ID": area.get("id", "N/A"),
-                    "Name": area.get("name", "N/A"),
-                    "Percent": area.get("percent", "N/A"),
-                }
-                for area in focus_areas
-            ]
-
-            # Prepare top investments table
-            top_investments = fund.get("topInvestments", [])
-            investments_table_data = [
-                {
-                    "ID": inv.get("id", "N/A"),
-                    "Symbol": inv.get("symbol", "N/A"),
-                    "Name": inv.get("name", "N/A"),
-                    "Logo": inv.get("logo", "N/A"),
-                }
-                for inv in top_investments
-            ]
-
-            # Prepare funding locations table
-            funding_locations = fund.get("fundingLocations", [])
-            locations_table_data = [
-                {
-                    "Code": loc.get("code", "N/A"),
-                    "Count": loc.get("count", "N/A"),
-                }
-                for loc in funding_locations
-            ]
-
-            # Prepare recent rounds table
-            recent_rounds = fund.get("recentRounds", [])
-            rounds_table_data = [
-                {
-                    "ID": round.get("id", "N/A"),
-                    "Name": round.get("name", "N/A"),
-                    "Logo": round.get("logo", "N/A"),
-                    "Raise": round.get("raise", "N/A"),
-                    "Date": round.get("date", "N/A"),
-                }
-                for round in recent_rounds
-            ]
-
-            # Prepare average rounds raise table
-            avg_rounds_raise = fund.get("avgRoundsRaise", [])
-            avg_raise_table_data = [
-                {
-                    "Raise From": raise_data.get("raiseFrom", "N/A"),
-                    "Raise To": raise_data.get("raiseTo", "N/A"),
-                    "Percent": raise_data.get("percent", "N/A"),
-                }
-                for raise_data in avg_rounds_raise
-            ]
-
-            # Prepare investment stages table
-            investment_stages = fund.get("investmentStages", [])
-            stages_table_data = [
-                {
-                    "Type": stage.get("type", ["N/A"])[0] if stage.get("type") else "N/A",
-                    "Percent": stage.get("percent", "N/A"),
-                }
-                for stage in investment_stages
-            ]
-
-            # Combine all tables into a single string
-            output = "Comprehensive Fund Data:\n"
-            output += tabulate(
-                main_table_data,
-                headers="keys",
-                tablefmt="grid",
-                stralign="left",
-                numalign="center",
-            )
+        if not fund:
+            return f"No data available for fund ID {fund_id}."
 
-            if links_table_data:
-                output += "\n\nLinks:\n"
-                output += tabulate(
-                    links_table_data,
-                    headers="keys",
-                    tablefmt="grid",
-                    stralign="left",
-                    numalign="center",
-                )
-
-            if focus_table_data:
-                output += "\n\nFocus Areas:\n"
-                output += tabulate(
-                    focus_table_data,
-                    headers="keys",
-                    tablefmt="grid",
-                    stralign="left",
-                    numalign="center",
-                )
-
-            if investments_table_data:
-                output += "\n\nTop Investments (Recent):\n"
-                output += tabulate(
-                    investments_table_data,
-                    headers="keys",
-                    tablefmt="grid",
-                    stralign="left",
-                    numalign="center",
-                )
-
-            if locations_table_data:
-                output += "\n\nFunding Locations:\n"
-                output += tabulate(
-                    locations_table_data,
-                    headers="keys",
-                    tablefmt="grid",
-                    stralign="left",
-                    numalign="center",
-                )
-
-            if rounds_table_data:
-                output += "\n\nRecent Funding Rounds:\n"
-                output += tabulate(
-                    rounds_table_data,
-                    headers="keys",
-                    tablefmt="grid",
-                    stralign="left",
-                    numalign="center",
-                )
-
-            if avg_raise_table_data:
-                output += "\n\nAverage Rounds Raise:\n"
-                output += tabulate(
-                    avg_raise_table_data,
-                    headers="keys",
-                    tablefmt="grid",
-                    stralign="left",
-                    numalign="center",
-                )
-
-            if stages_table_data:
-                output += "\n\nInvestment Stages:\n"
-                output += tabulate(
-                    stages_table_data,
-                    headers="keys",
-                    tablefmt="grid",
-                    stralign="left",
-                    numalign="center",
-                )
-
-            return output
+        # Rendering is pure CPU work; run it off the event loop so other
+        # tool calls keep being served meanwhile
+        return await asyncio.to_thread(_format_fund_detail, fund)
     except httpx.HTTPError as e:
         raise ValueError(f"Failed to fetch comprehensive data for fund ID {fund_id}: {str(e)}") from e
-        
+
+@mcp.tool()
+async def get_funds_detail(fund_ids: List[int]) -> str:
+    """
+    Fetch comprehensive metrics and investment data for several funds by ID from Cryptorank API.
+    The requests are issued concurrently; a fund that fails is reported in its own section.
+    Returns an ASCII table string of the fund data, one section per fund ID.
+
+    Parameters:
+    - fund_ids: Fund IDs to fetch (at most 20; duplicates are fetched once).
+    """
+    # Drop repeated IDs, keeping the order they were asked for in
+    fund_ids = list(dict.fromkeys(fund_ids))
+    if not fund_ids:
+        return "No fund IDs provided."
+    if len(fund_ids) > MAX_BATCH_FUND_IDS:
+        raise ValueError(f"At most {MAX_BATCH_FUND_IDS} fund IDs can be fetched at once, got {len(fund_ids)}.")
+
+    # Bound the concurrent requests so one call cannot flood the rate-limited API
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def fetch(fund_id: int) -> str:
+        async with semaphore:
+            return await get_fund_detail(fund_id)
+
+    results = await asyncio.gather(
+        *(fetch(fund_id) for fund_id in fund_ids),
+        return_exceptions=True,
+    )
+
+    sections = []
+    for fund_id, result in zip(fund_ids, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            result = str(result)
+        sections.append(f"Fund ID {fund_id}:\n{result}")
+    return "\n\n".join(sections)
 
 
 @mcp.tool()
@@ -478,71 +514,51 @@ async def get_fund_team(fund_id: int) -> str:
     Fetch detailed team information for a specific fund by ID from Cryptorank API.
     Returns an ASCII table string of the team data.
     """
-    api_key = os.getenv("CRYPTORANK_API_KEY")
-    if not api_key:
-        raise ValueError("CRYPTORANK_API_KEY environment variable is required in .env file.")
-
-    url = f"https://api.cryptorank.io/v2/funds/{fund_id}/team"
-    headers = {"X-Api-Key": api_key}
-
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            # Extract the 'data' field, which contains the team details
-            team_data = data.get("data", [])
-
-            if not team_data:
-                return f"No team data available for fund ID {fund_id}."
-
-            # Prepare team table
-            team_table_data = [
-                {
-                    "ID": member.get("id", "N/A"),
-                    "Name": member.get("name", "N/A"),
-                    "Jobs": ", ".join(member.get("jobs", ["N/A"])),
-                    "Priority": member.get("priority", "N/A"),
-                }
-                for member in team_data
-            ]
-
-            # Prepare links table
-            links_table_data = []
-            for member in team_data:
-                member_name = member.get("name", "N/A")
-                for link in member.get("links", []):
-                    links_table_data.append({
-                        "Member Name": member_name,
-                        "Link Type": link.get("type", "N/A"),
-                        "Link Value": link.get("value", "N/A"),
-                    })
-
-            # Combine tables into a single string
-            output = "Fund Team Details:\n"
-            output += tabulate(
-                team_table_data,
-                headers="keys",
-                tablefmt="grid",
-                stralign="left",
-                numalign="center",
+        data = await _fetch(f"{FUNDS_URL}/{fund_id}/team")
+
+        # Extract the 'data' field, which contains the team details
+        team_data = data.get("data", [])
+
+        if not team_data:
+            return f"No team data available for fund ID {fund_id}."
+
+        # Prepare the team and links tables in a single pass over the members
+        team_table_data = []
+        links_table_data = []
+        for member in team_data:
+            member_name = member.get("name", "N/A")
+            team_table_data.append((
+                member.get("id", "N/A"),
+                member_name,
+                ", ".join(member.get("jobs", ["N/A"])),
+                member.get("priority", "N/A"),
+            ))
+            links_table_data.extend(
+                (member_name, link.get("type", "N/A"), link.get("value", "N/A"))
+                for link in member.get("links", [])
             )
 
-            if links_table_data:
-                output += "\n\nTeam Social Links:\n"
-                output += tabulate(
-                    links_table_data,
-                    headers="keys",
-                    tablefmt="grid",
-                    stralign="left",
-                    numalign="center",
-                )
-
-            return output
+        # Collect the tables and join them once at the end
+        parts = ["Fund Team Details:\n" + _render_grid(team_table_data, TEAM_HEADERS)]
+
+        if links_table_data:
+            parts.append("Team Social Links:\n" + _render_grid(links_table_data, TEAM_LINK_HEADERS))
+
+        return "\n\n".join(parts)
     except httpx.HTTPError as e:
         raise ValueError(f"Failed to fetch team data for fund ID {fund_id}: {str(e)}") from e
-        
+
+async def _serve() -> None:
+    # The client is shared by every MCP session, so it is closed once the
+    # server stops, on the event loop that owns its connections
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        if _client is not None:
+            await _client.aclose()
+
 
 if __name__ == "__main__":
-    mcp.run()
+    # Serve on uvloop where it is installed (it does not support Windows)
+    anyio.run(_serve, backend_options={"use_uvloop": find_spec("uvloop") is not None})